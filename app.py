@@ -4,17 +4,21 @@
 # Date: 2025-10-22 (finalized fixes)
 
 import os
+import csv
+import tempfile
+import threading
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import pandas as pd
 from datetime import datetime, date, timedelta, time as dtime
 from io import BytesIO
-import base64
+from concurrent.futures import ThreadPoolExecutor
 
 # -------------------------
 # REQUIRE: supabase-py installed (package name: supabase-py)
 # -------------------------
 try:
-    from supabase import create_client, Client
+    from supabase import create_client, Client, ClientOptions
 except Exception as e:
     st.error("Module 'supabase' tidak ditemukan. Pastikan requirements.txt berisi 'supabase-py'.")
     raise
@@ -32,7 +36,15 @@ if not SUPABASE_URL or not SUPABASE_KEY:
     st.error("Supabase credentials missing. Tambahkan SUPABASE_URL & SUPABASE_KEY ke Streamlit Secrets.")
     st.stop()
 
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
+# One client per process: reruns reuse it (and its HTTP connections) instead of
+# building a new client every time the script executes.
+SUPABASE_TIMEOUT = 10  # seconds; fail a stalled request instead of hanging the rerun
+
+@st.cache_resource
+def get_supabase(url, key) -> Client:
+    return create_client(url, key, options=ClientOptions(postgrest_client_timeout=SUPABASE_TIMEOUT))
+
+supabase: Client = get_supabase(SUPABASE_URL, SUPABASE_KEY)
 
 # -------------------------
 # App config: data dir that is safe in Cloud vs Local
@@ -42,92 +54,407 @@ if os.getenv("STREAMLIT_RUNTIME") == "true":
 else:
     DATA_DIR = "data"
 
-if not os.path.exists(DATA_DIR):
-    try:
-        os.makedirs(DATA_DIR, exist_ok=True)
-    except Exception:
-        pass  # continue even if cannot create (read-only environment)
+# one-time setup per process (the script itself re-runs on every interaction)
+@st.cache_resource
+def _init_data_dir(path):
+    if not os.path.exists(path):
+        try:
+            os.makedirs(path, exist_ok=True)
+        except Exception:
+            pass  # continue even if cannot create (read-only environment)
+    return True
+
+_init_data_dir(DATA_DIR)
 
 # -------------------------
 # Utility helpers: CSV/Excel/PDF
 # -------------------------
-def save_backup_csv(df: pd.DataFrame, name: str):
-    fname = f"{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-    path = os.path.join(DATA_DIR, fname)
+def backup_stamp():
+    return datetime.now().strftime("%Y%m%d_%H%M%S")
+
+def backup_path(name: str, stamp=None):
+    return os.path.join(DATA_DIR, f"{name}_{stamp or backup_stamp()}.csv")
+
+def write_csv_fast(df: pd.DataFrame, out, header=True):
+    """out: path or binary file object (pages of one table can be written to the same handle)"""
+    # pyarrow's C++ CSV writer (pyarrow ships with streamlit); pandas for columns Arrow can't type
     try:
-        df.to_csv(path, index=False)
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pacsv.write_csv(table, out, pacsv.WriteOptions(include_header=header))
+    except (ImportError, TypeError, ValueError, NotImplementedError):
+        df.to_csv(out, header=header, index=False)
+
+@st.cache_resource
+def _backup_lock():
+    # one lock per process (a module-level Lock would be recreated on every rerun)
+    return threading.Lock()
+
+def append_backup_rows(name: str, rows, period="%Y%m%d_%H"):
+    """
+    Append just the newly written row(s) to a {name}_{period}.csv journal (hourly files by
+    default) — O(1) per write, instead of re-downloading and re-writing the whole table.
+    """
+    rows = rows if isinstance(rows, list) else [rows]
+    path = os.path.join(DATA_DIR, f"{name}_{datetime.now().strftime(period)}.csv")
+    fields = list(dict.fromkeys(k for row in rows for k in row))
+    try:
+        # serialized so concurrent sessions can't interleave lines or both write a header
+        with _backup_lock(), open(path, "a", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=fields, extrasaction="ignore")
+            if f.tell() == 0:
+                writer.writeheader()
+            writer.writerows(rows)
         return path
     except Exception as e:
         st.warning(f"Gagal menyimpan backup CSV ke {path}: {e}")
         return ""
 
+# export builders are memoized on the DataFrame's content: preparing the same data again
+# (another session, or after a rerun cleared session_state) reuses the bytes
+@st.cache_data(show_spinner=False, max_entries=8)
 def to_excel_bytes(df: pd.DataFrame):
+    # xlsxwriter constant_memory flushes each row as it is written (rows must go in order,
+    # which pandas' column-wise to_excel doesn't do, hence the explicit row loop)
+    import xlsxwriter
+
     output = BytesIO()
-    with pd.ExcelWriter(output, engine="openpyxl") as writer:
-        df.to_excel(writer, index=False)
+    wb = xlsxwriter.Workbook(output, {"constant_memory": True})
+    ws = wb.add_worksheet("Sheet1")
+    ws.write_row(0, 0, [str(c) for c in df.columns])
+    clean = df.astype(object).where(df.notna(), None)
+    for i, row in enumerate(clean.itertuples(index=False, name=None), start=1):
+        ws.write_row(i, 0, row)
+    wb.close()
     return output.getvalue()
 
-def excel_download_link(df: pd.DataFrame, filename="data.xlsx", label="Download Excel"):
-    b = to_excel_bytes(df)
-    b64 = base64.b64encode(b).decode()
-    href = f'<a href="data:application/vnd.openxmlformats-officedocument.spreadsheetml.sheet;base64,{b64}" download="{filename}">{label}</a>'
-    return href
+XLSX_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def to_pdf_bytes(df: pd.DataFrame, title="Report"):
+    # one Platypus Table (layout + page breaks done by reportlab) instead of drawString per cell
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4, landscape
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
 
-def csv_download_bytes(df: pd.DataFrame):
-    return df.to_csv(index=False).encode("utf-8")
+    output = BytesIO()
+    doc = SimpleDocTemplate(output, pagesize=landscape(A4), title=title,
+                            leftMargin=20, rightMargin=20, topMargin=20, bottomMargin=20)
+    data = [list(map(str, df.columns))] + df.fillna("").astype(str).values.tolist()
+    table = Table(data, repeatRows=1)
+    table.setStyle(TableStyle([
+        ("FONTSIZE", (0, 0), (-1, -1), 7),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
+        ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
+        ("VALIGN", (0, 0), (-1, -1), "TOP"),
+    ]))
+    doc.build([Paragraph(title, getSampleStyleSheet()["Title"]), Spacer(1, 8), table])
+    return output.getvalue()
+
+def lazy_download_button(key, label, build, file_name, mime, inputs=None):
+    """
+    Build export bytes only when the user asks for them, instead of on every rerun;
+    the result is kept in session_state so the download button survives reruns.
+    inputs: hashable description of what the file contains (filters, table versions);
+    prepared bytes are only offered again while it is unchanged.
+    """
+    if st.button(f"⚙️ Siapkan {label}", key=f"prep_{key}"):
+        st.session_state[f"dl_{key}"] = (inputs, build())
+    prepared = st.session_state.get(f"dl_{key}")
+    if prepared is not None and prepared[0] == inputs:
+        st.download_button(label, data=prepared[1], file_name=file_name, mime=mime, key=f"dl_btn_{key}")
 
 # -------------------------
 # Supabase wrapper helpers (compatible with supabase-py v2+)
 # -------------------------
-def sb_select(table, columns="*", filters=None, order=None, limit=None):
+def _apply_filters(q, filters):
+    for col, op, val in filters or []:
+        if op == "or_":
+            # col unused; val is a PostgREST or-expression
+            q = q.or_(val)
+        # safe mapping - call method by name
+        elif hasattr(q, op):
+            q = getattr(q, op)(col, val)
+        else:
+            # fallback: try eq
+            q = q.eq(col, val)
+    return q
+
+def _sb_rows(table, columns="*", filters=None, order=None, limit=None, offset=None):
+    q = _apply_filters(supabase.table(table).select(columns), filters)
+    # one (col, dir) pair, or a tuple of pairs applied in sequence (tie-breakers)
+    if order and not isinstance(order[0], (tuple, list)):
+        order = (order,)
+    for colname, direction in order or ():
+        if str(direction).lower() in ("desc", "false", "0"):
+            q = q.order(colname, desc=True)
+        else:
+            q = q.order(colname, desc=False)
+    if limit and offset:
+        q = q.range(offset, offset + limit - 1)
+    elif limit:
+        q = q.limit(limit)
+    r = q.execute()
+    return getattr(r, "data", None) or []
+
+# numeric columns are typed once at load (and cached typed), so callers compare them directly
+NUMERIC_COLS = ["available_stock", "minimum_stock", "cost", "downtime_hours", "duration_hours"]
+
+def rows_to_df(data):
+    # PostgREST rows all carry the same keys: let Arrow infer the columns once in C++,
+    # pandas for values it can't type (mixed types in one column)
+    try:
+        import pyarrow as pa
+        return pa.Table.from_pylist(data).to_pandas()
+    except (ImportError, TypeError, ValueError, NotImplementedError):
+        return pd.DataFrame(data)
+
+def _sb_fetch(table, columns="*", filters=None, order=None, limit=None, offset=None):
+    data = _sb_rows(table, columns, filters, order, limit, offset)
+    if not data:
+        return pd.DataFrame()
+    df = rows_to_df(data)
+    num = df.columns.intersection(NUMERIC_COLS)
+    if len(num):
+        df[num] = df[num].apply(pd.to_numeric, errors="coerce").fillna(0.0)
+    return df
+
+# Reads are cached for a short TTL so Streamlit reruns (every widget click) don't
+# hit Supabase again; errors are raised, so they are never cached.
+# `version` is only part of the cache key: see _table_versions.
+@st.cache_data(ttl=30, show_spinner=False)
+def _sb_fetch_cached(table, columns="*", filters=None, order=None, limit=None, offset=None, version=0):
+    return _sb_fetch(table, columns, filters, order, limit, offset)
+
+# Reference tables (assets, parts catalogue) change rarely and every write
+# through this app invalidates them anyway, so they can live longer.
+@st.cache_data(ttl=300, show_spinner=False)
+def _sb_fetch_cached_ref(table, columns="*", filters=None, order=None, limit=None, offset=None, version=0):
+    return _sb_fetch(table, columns, filters, order, limit, offset)
+
+REF_TABLES = {"assets", "spare_parts"}
+
+def _cached_fetcher(table):
+    return _sb_fetch_cached_ref if table in REF_TABLES else _sb_fetch_cached
+
+@st.cache_resource
+def _table_versions():
+    # table -> write counter, shared per process. Bumping it changes the cache key of
+    # that table's reads only, so e.g. logging an activity keeps the parts list cached.
+    return {}
+
+def _table_version(table):
+    return _table_versions().get(table, 0)
+
+def _fetch_cached(table, columns="*", filters=None, order=None, limit=None, offset=None):
+    return _cached_fetcher(table)(table, columns, tuple(filters) if filters else None, tuple(order) if order else None, limit, offset, _table_version(table))
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _sb_rpc_cached(fn, params=None):
+    return supabase.rpc(fn, params or {}).execute().data
+
+@st.cache_resource
+def _missing_db_objects():
+    # Postgres functions / views (see sql/) not deployed on this project; shared per process
+    return set()
+
+def invalidate_cache(table):
+    """Retire cached reads of `table` (its version is part of their key); rpc results span tables, so always go."""
+    versions = _table_versions()
+    versions[table] = versions.get(table, 0) + 1
+    _sb_rpc_cached.clear()
+
+def sb_select(table, columns="*", filters=None, order=None, limit=None, cache=True, offset=None):
     """
-    filters: list of tuples (col, op, val) where op in ["eq","like","neq","gt","lt","gte","lte"]
-    order: tuple (col, "asc"|"desc") or None
+    filters: list of tuples (col, op, val) where op in ["eq","like","neq","gt","lt","gte","lte","in_"],
+             or (None, "or_", "a.eq.1,b.eq.2") for an OR of conditions
+    order: tuple (col, "asc"|"desc"), a tuple of such pairs (later ones break ties), or None
+    offset: skip this many rows (used with limit for paging)
+    cache: serve from the TTL cache (set False when the result must be fresh)
     """
     try:
-        q = supabase.table(table).select(columns)
-        if filters:
-            for col, op, val in filters:
-                # safe mapping - call method by name
-                if hasattr(q, op):
-                    q = getattr(q, op)(col, val)
-                else:
-                    # fallback: try eq
-                    q = q.eq(col, val)
-        if order:
-            colname, direction = order[0], str(order[1]).lower()
-            if direction in ("desc", "false", "0"):
-                q = q.order(colname, desc=True)
-            else:
-                q = q.order(colname, desc=False)
-        if limit:
-            q = q.limit(limit)
-        r = q.execute()
-        data = getattr(r, "data", None)
-        return pd.DataFrame(data) if data else pd.DataFrame()
+        if cache:
+            return _fetch_cached(table, columns, filters, order, limit, offset)
+        return _sb_fetch(table, columns, filters, order, limit, offset)
     except Exception as e:
         st.error(f"Supabase select error: {e}")
         return pd.DataFrame()
 
+def sb_rows(table, columns="*", filters=None, order=None, limit=None):
+    """Uncached select returning the raw list of dicts, for internal logic that doesn't need a DataFrame."""
+    try:
+        return _sb_rows(table, columns, filters, order, limit)
+    except Exception as e:
+        st.error(f"Supabase select error: {e}")
+        return []
+
+BACKUP_TABLES = ["spare_parts", "work_orders", "assets", "pm_plans", "activity_log", "stock_txn", "wo_parts"]
+
+def iter_table_pages(table, page_size=1000):
+    """Yield a table as DataFrames of up to page_size rows (PostgREST range requests, ordered by id)."""
+    start = 0
+    while True:
+        r = supabase.table(table).select("*").order("id").range(start, start + page_size - 1).execute()
+        rows = getattr(r, "data", None) or []
+        if not rows:
+            return
+        yield rows_to_df(rows)
+        if len(rows) < page_size:
+            return
+        start += page_size
+
+def backup_table_csv(table, name, page_size=1000, stamp=None):
+    """
+    Stream a whole table to a backup CSV page by page, so memory stays
+    O(page_size) instead of O(table). Returns "" if empty or on error.
+    """
+    path = backup_path(name, stamp)
+    # unique temp file: two sessions backing up in the same second must not share one
+    fd, tmp = tempfile.mkstemp(dir=DATA_DIR, suffix=".tmp")
+    try:
+        first = True
+        with os.fdopen(fd, "wb") as f:
+            for chunk in iter_table_pages(table, page_size):
+                write_csv_fast(chunk, f, header=first)
+                first = False
+        if first:
+            os.remove(tmp)
+            return ""
+        os.replace(tmp, path)
+        return path
+    except Exception as e:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        st.warning(f"Gagal menyimpan backup CSV ke {path}: {e}")
+        return ""
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _table_csv_bytes(table, version=0):
+    buf = BytesIO()
+    first = True
+    for chunk in iter_table_pages(table):
+        write_csv_fast(chunk, buf, header=first)
+        first = False
+    return buf.getvalue()
+
+def table_csv_bytes(table):
+    """Whole table as CSV bytes, encoded page by page (no full-table DataFrame); b"" on error."""
+    try:
+        return _table_csv_bytes(table, _table_version(table))
+    except Exception as e:
+        st.error(f"Supabase select error: {e}")
+        return b""
+
+def _sb_count(table, filters=None):
+    q = _apply_filters(supabase.table(table).select("id", count="exact", head=True), filters)
+    return q.execute().count or 0
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _sb_count_cached(table, filters=None, version=0):
+    return _sb_count(table, filters)
+
+def sb_count(table, filters=None, cache=False):
+    """Row count via PostgREST count=exact with head=True: only the count comes back, no rows."""
+    try:
+        if cache:
+            return _sb_count_cached(table, tuple(filters) if filters else None, _table_version(table))
+        return _sb_count(table, filters)
+    except Exception as e:
+        st.error(f"Supabase count error: {e}")
+        return 0
+
+def sb_one(table, match_col, match_val, columns="*"):
+    """Single row as a dict (or None) — no DataFrame for one-row lookups."""
+    rows = sb_rows(table, columns, filters=[(match_col, "eq", match_val)], limit=1)
+    return rows[0] if rows else None
+
+def run_parallel(*fns):
+    """
+    Call independent zero-argument functions concurrently (each is typically one Supabase
+    round-trip) and return their results in order; the first exception is re-raised.
+    """
+    ctx = get_script_run_ctx()
+
+    def run(fn):
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return fn()
+
+    with ThreadPoolExecutor(max_workers=min(4, len(fns) or 1)) as ex:
+        futures = [ex.submit(run, fn) for fn in fns]
+    return [f.result() for f in futures]
+
+def sb_rpc(fn, params=None, cache=False):
+    """
+    Call a Postgres function. Returns its data, or None when the call fails or the
+    function is not deployed (callers then fall back to client-side logic).
+    """
+    if fn in _missing_db_objects():
+        return None
+    try:
+        if cache:
+            return _sb_rpc_cached(fn, params)
+        return supabase.rpc(fn, params or {}).execute().data
+    except Exception as e:
+        if getattr(e, "code", None) == "PGRST202":  # function not found
+            _missing_db_objects().add(fn)
+        else:
+            st.error(f"Supabase rpc error: {e}")
+        return None
+
 def sb_insert(table, payload):
+    """payload: dict or list of dicts — pass a list to insert many rows in one request"""
     try:
         r = supabase.table(table).insert(payload).execute()
+        invalidate_cache(table)
         return r
     except Exception as e:
         st.error(f"Supabase insert error: {e}")
         return None
 
-def sb_upsert(table, payload):
+def _update_or_insert(table, payload, match_col):
+    # upsert without a unique index: update each row by match_col, insert the ones that matched nothing
+    rows = payload if isinstance(payload, list) else [payload]
+    new = []
+    r = None
+    for row in rows:
+        r = sb_update(table, row, match_col, row[match_col])
+        if r is None:
+            return None
+        if not r.data:
+            new.append(row)
+    if new:
+        r = sb_insert(table, new)
+    return r
+
+def sb_upsert(table, payload, on_conflict=None):
+    """
+    payload: dict or list of dicts (one request); on_conflict: unique column to merge on.
+    If that column has no unique index (sql/indexes.sql not run) rows are updated-then-inserted.
+    """
+    key = f"{table}.{on_conflict}"
+    if on_conflict and key in _missing_db_objects():
+        return _update_or_insert(table, payload, on_conflict)
     try:
-        r = supabase.table(table).upsert(payload).execute()
+        if on_conflict:
+            r = supabase.table(table).upsert(payload, on_conflict=on_conflict).execute()
+        else:
+            r = supabase.table(table).upsert(payload).execute()
+        invalidate_cache(table)
         return r
     except Exception as e:
+        if on_conflict and getattr(e, "code", None) == "42P10":  # no unique constraint on on_conflict
+            _missing_db_objects().add(key)
+            return _update_or_insert(table, payload, on_conflict)
         st.error(f"Supabase upsert error: {e}")
         return None
 
 def sb_update(table, payload, match_col, match_val):
     try:
         r = supabase.table(table).update(payload).eq(match_col, match_val).execute()
+        invalidate_cache(table)
         return r
     except Exception as e:
         st.error(f"Supabase update error: {e}")
@@ -136,6 +463,7 @@ def sb_update(table, payload, match_col, match_val):
 def sb_delete(table, match_col, match_val):
     try:
         r = supabase.table(table).delete().eq(match_col, match_val).execute()
+        invalidate_cache(table)
         return r
     except Exception as e:
         st.error(f"Supabase delete error: {e}")
@@ -145,14 +473,98 @@ def sb_delete(table, match_col, match_val):
 # Domain functions: Inventory, Assets, Work Orders, PM, Activity
 # -------------------------
 # Inventory
-def load_inventory():
-    return sb_select("spare_parts", "*", order=("nama_barang", "asc"))
+def part_search_filters(keyword=""):
+    """Server-side case-insensitive match on kode / nama (trigram-indexed, sql/indexes.sql)."""
+    # drop characters that delimit a PostgREST or-expression
+    k = "".join(c for c in keyword.strip() if c not in ',()"\\')
+    if not k:
+        return None
+    return [(None, "or_", f"nama_barang.ilike.*{k}*,kode_barang.ilike.*{k}*")]
+
+# list view columns; long text (spesifikasi) is fetched per part on demand
+PART_LIST_COLS = "id,kode_barang,nama_barang,satuan,available_stock,minimum_stock"
+
+PART_PAGE_SIZE = 200
+
+def load_inventory(keyword="", columns=PART_LIST_COLS, limit=None, offset=None):
+    # id breaks ties between equal names, so offset pages are stable
+    return sb_select("spare_parts", columns, filters=part_search_filters(keyword), order=(("nama_barang", "asc"), ("id", "asc")),
+                     limit=limit, offset=offset)
+
+# generated column spare_parts.is_low with a partial index (sql/low_stock.sql)
+LOW_STOCK_FILTER = ("is_low", "eq", True)
+
+def _is_low_missing(e):
+    # only "column does not exist" means sql/low_stock.sql isn't deployed; anything else is reported
+    if getattr(e, "code", None) in ("42703", "PGRST204"):
+        _missing_db_objects().add("spare_parts.is_low")  # client-side fallback is always correct
+        return True
+    st.error(f"Supabase select error: {e}")
+    return False
+
+def load_low_stock(keyword=""):
+    """Parts below minimum stock, filtered on spare_parts.is_low; None if the column is not deployed (empty on error)."""
+    if "spare_parts.is_low" in _missing_db_objects():
+        return None
+    try:
+        filters = tuple(part_search_filters(keyword) or ()) + (LOW_STOCK_FILTER,)
+        return _sb_fetch_cached("spare_parts", PART_LIST_COLS, filters, ("nama_barang", "asc"),
+                                version=_table_version("spare_parts"))
+    except Exception as e:
+        return None if _is_low_missing(e) else pd.DataFrame()
+
+def count_low_stock():
+    """Number of parts below minimum stock: a head count on is_low, else compared client-side."""
+    if "spare_parts.is_low" not in _missing_db_objects():
+        try:
+            return _sb_count_cached("spare_parts", (LOW_STOCK_FILTER,), _table_version("spare_parts"))
+        except Exception:
+            # a failed HEAD has no body, so its code is only the HTTP status: classify it with a GET
+            try:
+                supabase.table("spare_parts").select("id").eq("is_low", True).limit(1).execute()
+            except Exception as e:
+                if not _is_low_missing(e):
+                    return 0
+            # column missing, or the count alone failed: compare client-side for this run
+    spare = sb_select("spare_parts", "available_stock,minimum_stock")
+    return 0 if spare.empty else int(low_stock_mask(spare).sum())
+
+def low_stock_mask(df: pd.DataFrame):
+    # stock columns are already float (NUMERIC_COLS); compare the raw arrays, no casts or index alignment
+    return df["available_stock"].to_numpy() < df["minimum_stock"].to_numpy()
+
+PART_COLS = ["kode_barang", "nama_barang", "spesifikasi", "satuan", "available_stock", "minimum_stock"]
+
+def import_parts(df_new: pd.DataFrame):
+    """Upsert a spare-parts sheet (columns as PART_COLS) in a single bulk request; returns rows sent."""
+    df_new = df_new.rename(columns=lambda c: str(c).strip().lower().replace(" ", "_"))
+    missing = {"kode_barang", "nama_barang"} - set(df_new.columns)
+    if missing:
+        st.warning(f"Kolom wajib tidak ada: {', '.join(sorted(missing))}")
+        return 0
+    df_new = df_new.reindex(columns=PART_COLS).dropna(subset=["kode_barang", "nama_barang"])
+    # column-wise coercion instead of per-row parsing
+    for col in ("kode_barang", "nama_barang"):
+        df_new[col] = df_new[col].astype(str).str.strip()
+    df_new["spesifikasi"] = df_new["spesifikasi"].fillna("").astype(str)
+    df_new["satuan"] = df_new["satuan"].fillna("pcs").astype(str)
+    for col in ("available_stock", "minimum_stock"):
+        df_new[col] = pd.to_numeric(df_new[col], errors="coerce").fillna(0.0).astype(float)
+    # Postgres rejects an upsert that touches the same key twice
+    df_new = df_new.drop_duplicates("kode_barang", keep="last")
+    if df_new.empty:
+        return 0
+    records = df_new.to_dict(orient="records")
+    if sb_upsert("spare_parts", records, on_conflict="kode_barang") is None:
+        return 0
+    # journal like single saves (add_or_update_part)
+    append_backup_rows("spare_parts_backup", records)
+    return len(records)
 
 def add_or_update_part(kode, nama, spesifikasi, satuan, available_stock, minimum_stock):
     if not kode or not nama:
         st.warning("Kode & Nama wajib diisi")
         return
-    existing = sb_select("spare_parts", "*", filters=[("kode_barang", "eq", kode)])
     payload = {
         "kode_barang": kode,
         "nama_barang": nama,
@@ -161,21 +573,28 @@ def add_or_update_part(kode, nama, spesifikasi, satuan, available_stock, minimum
         "available_stock": float(available_stock or 0),
         "minimum_stock": float(minimum_stock or 0)
     }
-    if not existing.empty:
-        sb_update("spare_parts", payload, "kode_barang", kode)
-        st.success(f"Part {kode} diperbarui.")
-    else:
-        sb_insert("spare_parts", payload)
-        st.success(f"Part {kode} ditambahkan.")
+    # single upsert on the unique kode_barang: insert or update in one round-trip, no read-then-write race
+    # (update-then-insert until the unique index from sql/indexes.sql exists)
+    if sb_upsert("spare_parts", payload, on_conflict="kode_barang") is None:
+        return
+    st.success(f"Part {kode} disimpan.")
     # backup
-    df = load_inventory()
-    if not df.empty:
-        save_backup_csv(df, "spare_parts_backup")
+    append_backup_rows("spare_parts_backup", payload)
 
 # Assets (equipment)
 def load_assets():
     return sb_select("assets", "*", order=("name", "asc"))
 
+def load_asset_options():
+    # (id, label) tuples for a selectbox: the label is shown, the id is submitted — no lookup map needed.
+    # Only id,name are fetched (cached like every sb_select read) since the dropdown needs nothing else.
+    assets_df = sb_select("assets", "id,name", order=("name", "asc"))
+    opts = [(None, "-")]
+    if not assets_df.empty:
+        labels = assets_df["id"].astype(str) + " - " + assets_df["name"].astype(str)
+        opts += list(zip(assets_df["id"].astype(int).tolist(), labels.tolist()))
+    return opts
+
 def add_asset(code, name, location, category, criticality, commissioning_date, notes):
     payload = {
         "code": code,
@@ -190,10 +609,18 @@ def add_asset(code, name, location, category, criticality, commissioning_date, n
     st.success("Asset ditambahkan.")
 
 # Work Orders
+# list view columns; description and the rest are loaded per WO on demand
+WO_LIST_COLS = "id,wo_no,type,asset_id,title,status,priority,requester,assignee,created_at,due_date"
+WO_PAGE_SIZE = 100
+WO_STATUSES = ["Open", "In Progress", "On Hold", "Closed", "Cancelled"]
+
 def make_wo_no():
     today = datetime.now().strftime("%Y%m%d")
-    df = sb_select("work_orders", "id", filters=[("created_at", "like", f"{today}%")])
-    seq = 1 if df.empty else len(df) + 1
+    # atomic counter when next_wo_no() (sql/wo_seq.sql) is deployed
+    wo_no = sb_rpc("next_wo_no", {"p_day": today})
+    if wo_no:
+        return wo_no
+    seq = sb_count("work_orders", [("wo_no", "like", f"WO-{today}-%")]) + 1
     return f"WO-{today}-{seq:03d}"
 
 def create_work_order(wo_type, asset_id, title, description, requester, assignee, priority, due_date):
@@ -213,12 +640,11 @@ def create_work_order(wo_type, asset_id, title, description, requester, assignee
         "downtime_hours": 0,
         "cost": 0.0
     }
-    sb_insert("work_orders", payload)
+    if sb_insert("work_orders", payload) is None:
+        return
     st.success(f"Work Order {wo_no} dibuat.")
     # backup
-    df = sb_select("work_orders", "*")
-    if not df.empty:
-        save_backup_csv(df, "work_orders_backup")
+    append_backup_rows("work_orders_backup", payload)
 
 # Preventive Maintenance (PM)
 def load_pm_plans():
@@ -235,50 +661,57 @@ def add_pm_plan(asset_id, task, frequency_days, next_due_date):
     st.success("PM Plan ditambahkan.")
 
 # Activity logs
-def add_activity(asset_id, date_, type_, location, description, technician, start_time, end_time, notes):
-    dur = 0.0
-    try:
-        dur = round((end_time - start_time).total_seconds() / 3600, 2)
-    except Exception:
-        dur = 0.0
-    payload = {
+def activity_payload(asset_id, date_: date, type_, location, description, technician,
+                     start_time: datetime, end_time: datetime, notes):
+    # the form passes a date and two datetimes (validated end >= start), so no type checks here
+    return {
         "asset_id": asset_id,
-        "date": date_.isoformat() if isinstance(date_, date) else str(date_),
+        "date": date_.isoformat(),
         "type": type_,
         "location": location,
         "description": description,
         "technician": technician,
-        "start_time": start_time.isoformat() if isinstance(start_time, datetime) else str(start_time),
-        "end_time": end_time.isoformat() if isinstance(end_time, datetime) else str(end_time),
-        "duration_hours": dur,
+        "start_time": start_time.isoformat(),
+        "end_time": end_time.isoformat(),
+        "duration_hours": round((end_time - start_time).total_seconds() / 3600, 2),
         "notes": notes
     }
-    sb_insert("activity_log", payload)
-    st.success("Activity tercatat.")
+
+ACTIVITY_TYPES = ["Breakdown", "Shutdown", "Routine"]
+ACTIVITY_LIST_COLS = "id,date,type,asset_id,location,technician,duration_hours"
+ACTIVITY_PAGE_SIZE = 200
+
+def add_activities(payloads):
+    """payloads: dict or list of dicts from activity_payload(); a list is sent as one bulk insert."""
+    rows = payloads if isinstance(payloads, list) else [payloads]
+    if not rows:
+        return False
+    if sb_insert("activity_log", rows) is None:
+        return False
+    st.success("Activity tercatat." if len(rows) == 1 else f"{len(rows)} activity tercatat.")
     # backup
-    df = sb_select("activity_log", "*")
-    if not df.empty:
-        save_backup_csv(df, "activity_log_backup")
+    # one file per month: activities are logged often, and a month is what gets reviewed
+    append_backup_rows("activity_log_backup", rows, period="%Y%m")
+    return True
 
 # Reports helpers
 def generate_basic_reports():
     # summarize WO by status, inventory low stock, PM due
-    wo = sb_select("work_orders", "status,downtime_hours,cost")
-    spare = load_inventory()
-    pm = load_pm_plans()
-    stats = {}
-    stats["total_wo"] = 0 if wo.empty else len(wo)
-    stats["open_wo"] = 0 if wo.empty else int((wo["status"] == "Open").sum())
-    stats["total_parts"] = 0 if spare.empty else len(spare)
-    try:
-        stats["low_stock_count"] = 0 if spare.empty else int((spare["available_stock"].astype(float) < spare["minimum_stock"].astype(float)).sum())
-    except Exception:
-        stats["low_stock_count"] = 0
-    try:
-        stats["pm_due"] = 0 if pm.empty else int((pd.to_datetime(pm["next_due_date"], errors="coerce").dt.date <= date.today()).sum())
-    except Exception:
-        stats["pm_due"] = 0
-    return stats
+    # single round-trip when cmms_report_stats() (sql/report_stats.sql) is deployed
+    stats = sb_rpc("cmms_report_stats", cache=True)
+    if stats:
+        return dict(stats)
+    # otherwise head counts (no rows transferred), issued concurrently
+    today = date.today().isoformat()
+    keys = ["total_wo", "open_wo", "total_parts", "low_stock_count", "pm_due"]
+    counts = run_parallel(
+        lambda: sb_count("work_orders", cache=True),
+        lambda: sb_count("work_orders", [("status", "eq", "Open")], cache=True),
+        lambda: sb_count("spare_parts", cache=True),
+        count_low_stock,
+        lambda: sb_count("pm_plans", [("next_due_date", "lte", today)], cache=True),
+    )
+    return dict(zip(keys, counts))
 
 # -------------------------
 # Streamlit UI — dark theme controlled by .streamlit/config.toml
@@ -288,10 +721,79 @@ st.set_page_config(page_title="BEP CMMS Cloud", page_icon="🛠️", layout="wid
 st.sidebar.title("📁 Navigasi")
 menu = st.sidebar.radio("", ["Dashboard", "Work Orders", "Preventive (PM)", "Inventory", "Assets", "Activity", "Reports", "Settings"])
 
+# List sections run as fragments: their own widgets (filters, paging, detail pickers)
+# rerun only the fragment, not the whole page with its forms and other queries.
+@st.fragment
+def wo_list_fragment():
+    c1, c2 = st.columns([3, 1])
+    status_filter = c1.multiselect("Filter Status", WO_STATUSES)
+    page = c2.number_input("Halaman", min_value=1, value=1, step=1, key="wo_page")
+    # filter and page server-side so only the rows shown are transferred
+    wo_filters = [("status", "in_", tuple(status_filter))] if status_filter else None
+    df = sb_select("work_orders", WO_LIST_COLS, filters=wo_filters, order=(("created_at", "desc"), ("id", "desc")),
+                   limit=WO_PAGE_SIZE, offset=(page - 1) * WO_PAGE_SIZE)
+    if not df.empty:
+        st.dataframe(df, use_container_width=True, hide_index=True)
+        with st.expander("🔍 Detail Work Order"):
+            # an expander body runs even when collapsed: fetch the row only once asked for
+            if st.toggle("Tampilkan detail", key="wo_detail"):
+                labels = df["wo_no"].astype(str).str.cat([df["status"].astype(str), df["title"].astype(str)], sep=" - ")
+                wo_id, _ = st.selectbox("WO", list(zip(df["id"].tolist(), labels.tolist())), format_func=lambda o: o[1])
+                detail = sb_one("work_orders", "id", wo_id)
+                if detail:
+                    st.write(detail)
+        # the PDF covers every WO matching the filter, not just this page
+        lazy_download_button("wo_pdf", "📄 Unduh PDF Work Orders",
+                             lambda: to_pdf_bytes(sb_select("work_orders", WO_LIST_COLS, filters=wo_filters, order=("created_at", "desc")),
+                                                  "BEP CMMS — Work Orders"),
+                             "work_orders.pdf", "application/pdf",
+                             inputs=(tuple(status_filter), _table_version("work_orders")))
+    else:
+        st.info("Belum ada WO." if page == 1 else "Tidak ada data di halaman ini.")
+
+@st.fragment
+def activity_list_fragment():
+    # list view: display columns only, one page at a time; full rows are fetched on demand below
+    c1, c2, c3, c4 = st.columns(4)
+    f_start = c1.date_input("Dari", value=date.today() - timedelta(days=30), key="act_from")
+    f_end = c2.date_input("Sampai", value=date.today(), key="act_to")
+    f_type = c3.selectbox("Type", ["All"] + ACTIVITY_TYPES, key="act_type")
+    page = c4.number_input("Halaman", min_value=1, value=1, step=1, key="act_page")
+    # date/type predicates run in Postgres, so only matching rows are downloaded
+    filters = [("date", "gte", f_start.isoformat()), ("date", "lte", f_end.isoformat())]
+    if f_type != "All":
+        filters.append(("type", "eq", f_type))
+    # id breaks ties between same-day rows, so offset pages neither repeat nor skip rows
+    df = sb_select("activity_log", ACTIVITY_LIST_COLS, filters=filters, order=(("date", "desc"), ("id", "desc")),
+                   limit=ACTIVITY_PAGE_SIZE, offset=(page - 1) * ACTIVITY_PAGE_SIZE)
+    if not df.empty:
+        st.dataframe(df, use_container_width=True, hide_index=True)
+        with st.expander("🔍 Detail Activity"):
+            # an expander body runs even when collapsed: fetch the row only once asked for
+            if st.toggle("Tampilkan detail", key="act_detail"):
+                act_id = st.selectbox("ID", df["id"].tolist())
+                detail = sb_one("activity_log", "id", act_id)
+                if detail:
+                    st.write(detail)
+    else:
+        st.info("Tidak ada activity untuk filter ini." if page == 1 else "Tidak ada data di halaman ini.")
+
+@st.fragment
+def csv_download_fragment():
+    st.subheader("Unduh CSV")
+    t = st.selectbox("Tabel", BACKUP_TABLES)
+    # the table is only downloaded and encoded when the user asks for it
+    lazy_download_button(f"csv_{t}", f"⬇️ Unduh {t}.csv", lambda: table_csv_bytes(t), f"{t}.csv", "text/csv",
+                         inputs=_table_version(t))
+
 # DASHBOARD
 if menu == "Dashboard":
     st.title("🛠️ Dashboard — BEP CMMS")
-    stats = generate_basic_reports()
+    # summary counts and the recent-WO list are independent: fetch them concurrently
+    stats, df_wo = run_parallel(
+        generate_basic_reports,
+        lambda: sb_select("work_orders", "wo_no,type,title,status,priority,created_at,due_date", order=("created_at", "desc"), limit=10),
+    )
     c1, c2, c3, c4 = st.columns(4)
     c1.metric("Open WO", stats["open_wo"])
     c2.metric("PM Due / Overdue", stats["pm_due"])
@@ -299,7 +801,6 @@ if menu == "Dashboard":
     c4.metric("Total Parts", stats["total_parts"])
     st.markdown("---")
     st.subheader("Work Orders Terbaru")
-    df_wo = sb_select("work_orders", "wo_no,type,title,status,priority,created_at,due_date", order=("created_at", "desc"), limit=10)
     if not df_wo.empty:
         st.dataframe(df_wo, use_container_width=True)
     else:
@@ -311,9 +812,7 @@ elif menu == "Work Orders":
     with st.expander("➕ Buat Work Order"):
         with st.form("form_wo", clear_on_submit=True):
             wo_type = st.selectbox("Tipe", ["CM", "PM"])
-            assets_df = load_assets()
-            asset_opts = ["-"] + (assets_df["id"].astype(str).tolist() if not assets_df.empty else [])
-            asset_id = st.selectbox("Asset (ID)", asset_opts)
+            asset = st.selectbox("Asset", load_asset_options(), format_func=lambda o: o[1])
             title = st.text_input("Judul")
             desc = st.text_area("Deskripsi")
             requester = st.text_input("Requester")
@@ -322,29 +821,23 @@ elif menu == "Work Orders":
             due = st.date_input("Due Date", value=date.today())
             submit = st.form_submit_button("Buat WO")
         if submit:
-            create_work_order(wo_type, None if asset_id == "-" else int(asset_id), title, desc, requester, assignee, priority, due)
+            create_work_order(wo_type, asset[0], title, desc, requester, assignee, priority, due)
 
     st.markdown("---")
-    df = sb_select("work_orders", "*", order=("created_at", "desc"))
-    if not df.empty:
-        st.dataframe(df, use_container_width=True)
-    else:
-        st.info("Belum ada WO.")
+    wo_list_fragment()
 
 # PM
 elif menu == "Preventive (PM)":
     st.title("🗓️ Preventive Maintenance (PM)")
     with st.expander("➕ Tambah PM Plan"):
         with st.form("form_pm", clear_on_submit=True):
-            assets_df = load_assets()
-            asset_opts = ["-"] + (assets_df["id"].astype(str).tolist() if not assets_df.empty else [])
-            asset_id = st.selectbox("Asset (ID)", asset_opts)
+            asset = st.selectbox("Asset", load_asset_options(), format_func=lambda o: o[1])
             task = st.text_input("Task")
             freq = st.number_input("Frequency (hari)", min_value=1, value=30)
             next_due = st.date_input("Next Due", value=date.today() + timedelta(days=freq))
             submit = st.form_submit_button("Simpan PM")
         if submit:
-            add_pm_plan(None if asset_id == "-" else int(asset_id), task, freq, next_due)
+            add_pm_plan(asset[0], task, freq, next_due)
 
     st.markdown("---")
     df = load_pm_plans()
@@ -368,19 +861,73 @@ elif menu == "Inventory":
         if submit:
             add_or_update_part(kode.strip(), nama.strip(), spes.strip(), satuan.strip(), avail, mini)
 
+    with st.expander("📥 Import Spare Parts (Excel/CSV)"):
+        st.caption("Kolom: " + ", ".join(PART_COLS) + " — baris dengan kode_barang yang sama akan diperbarui.")
+        up = st.file_uploader("File", type=["xlsx", "csv"])
+        if up is not None and st.button("Import"):
+            try:
+                df_new = pd.read_csv(up) if up.name.lower().endswith(".csv") else pd.read_excel(up, engine="calamine")
+            except Exception as e:
+                st.error(f"Gagal membaca file {up.name}: {e}")
+                df_new = None
+            if df_new is not None:
+                n = import_parts(df_new)
+                if n:
+                    st.success(f"{n} part diimport.")
+
     st.markdown("---")
-    df = load_inventory()
-    if not df.empty:
-        st.dataframe(df, use_container_width=True)
+    c1, c2, c3 = st.columns([3, 1, 1])
+    keyword = c1.text_input("Cari (kode / nama)")
+    low_only = c2.checkbox("Hanya stok rendah")
+    page = c3.number_input("Halaman", min_value=1, value=1, step=1, key="parts_page")
+    # low-stock rows are filtered server-side (is_low); the full catalogue is only fetched when needed
+    # the keyword is matched server-side too, so only matching rows are downloaded
+    low = load_low_stock(keyword) if low_only else None
+    shown = None
+    if low is not None:
+        if not low.empty:
+            shown = low
+        else:
+            st.info("Tidak ada part dengan stok rendah.")
+        df = None
+    else:
+        if low_only:
+            # is_low not deployed: compare stock client-side over the whole catalogue
+            df = load_inventory(keyword)
+        else:
+            # one page from the server; the count is a head request
+            df = load_inventory(keyword, limit=PART_PAGE_SIZE, offset=(page - 1) * PART_PAGE_SIZE)
+            total = sb_count("spare_parts", part_search_filters(keyword), cache=True)
+            st.caption(f"Halaman {page} dari {max(1, -(-total // PART_PAGE_SIZE))} ({total} part)")
+        if not df.empty:
+            # keyword already matched server-side; only the low-stock fallback filters here
+            shown = df[low_stock_mask(df)] if low_only else df
+        elif page > 1 and not low_only:
+            st.info("Tidak ada data di halaman ini.")
+        elif keyword.strip():
+            st.info("Tidak ada part yang cocok.")
+        else:
+            st.info("Belum ada data spare parts.")
+    if shown is not None:
+        st.dataframe(shown, use_container_width=True, hide_index=True)
+        if not shown.empty:
+            with st.expander("🔍 Detail Part"):
+                # an expander body runs even when collapsed: fetch the row only once asked for
+                if st.toggle("Tampilkan detail", key="part_detail"):
+                    labels = shown["kode_barang"].astype(str).str.cat(shown["nama_barang"].astype(str), sep=" - ")
+                    kode, _ = st.selectbox("Part", list(zip(shown["kode_barang"].tolist(), labels.tolist())), format_func=lambda o: o[1])
+                    detail = sb_one("spare_parts", "kode_barang", kode)
+                    if detail:
+                        st.write(detail)
+    if df is None or not df.empty or keyword.strip() or page > 1:
         if st.button("⬇️ Backup CSV spare_parts"):
-            path = save_backup_csv(df, "spare_parts_backup")
+            path = backup_table_csv("spare_parts", "spare_parts_backup")
             if path:
                 st.success(f"Backup saved: {path}")
             else:
                 st.warning("Backup gagal disimpan.")
-        st.markdown(excel_download_link(df, filename="spare_parts.xlsx", label="📘 Unduh Excel Spare Parts"), unsafe_allow_html=True)
-    else:
-        st.info("Belum ada data spare parts.")
+        lazy_download_button("parts_xlsx", "📘 Unduh Excel Spare Parts", lambda: to_excel_bytes(load_inventory(columns="*")), "spare_parts.xlsx", XLSX_MIME,
+                             inputs=_table_version("spare_parts"))
 
 # ASSETS
 elif menu == "Assets":
@@ -411,8 +958,8 @@ elif menu == "Activity":
     with st.expander("➕ Tambah Activity Report"):
         with st.form("form_act", clear_on_submit=True):
             act_date = st.date_input("Date", value=date.today())
-            act_type = st.selectbox("Type", ["Breakdown", "Shutdown", "Routine"])
-            asset_input = st.text_input("Asset ID (optional)")
+            act_type = st.selectbox("Type", ACTIVITY_TYPES)
+            asset = st.selectbox("Asset (optional)", load_asset_options(), format_func=lambda o: o[1])
             loc = st.text_input("Location")
             desc = st.text_area("Description")
             tech = st.text_input("Technician")
@@ -421,18 +968,39 @@ elif menu == "Activity":
             e_date = st.date_input("End Date", value=act_date, key="edt")
             e_time = st.time_input("End Time", value=dtime(9, 0), key="ett")
             notes = st.text_area("Notes")
-            submit = st.form_submit_button("Simpan Activity")
-        if submit:
+            c1, c2 = st.columns(2)
+            submit = c1.form_submit_button("Simpan Activity")
+            queue = c2.form_submit_button("Tambah ke Antrian")
+        if submit or queue:
             st_dt = datetime.combine(s_date, s_time)
             en_dt = datetime.combine(e_date, e_time)
-            add_activity(None if not asset_input else int(asset_input), act_date, act_type, loc, desc, tech, st_dt, en_dt, notes)
+            if en_dt < st_dt:
+                st.error("End harus sama atau setelah Start.")
+            else:
+                row = activity_payload(asset[0], act_date, act_type, loc, desc, tech, st_dt, en_dt, notes)
+                if submit:
+                    add_activities(row)
+                else:
+                    st.session_state.setdefault("pending_activity", []).append(row)
+
+    # queued entries are saved together in a single insert
+    pending = st.session_state.get("pending_activity", [])
+    if pending:
+        st.caption(f"Antrian: {len(pending)} activity belum disimpan")
+        st.dataframe(pd.DataFrame(pending), use_container_width=True)
+        c1, c2 = st.columns(2)
+        # rerun after clearing, otherwise the queue drawn above stays on screen until the next click
+        if c1.button(f"💾 Simpan Semua ({len(pending)})"):
+            if add_activities(pending):
+                st.session_state["pending_activity"] = []
+                st.toast(f"{len(pending)} activity tercatat.")  # a toast survives the rerun
+                st.rerun()
+        if c2.button("🗑️ Kosongkan Antrian"):
+            st.session_state["pending_activity"] = []
+            st.rerun()
 
     st.markdown("---")
-    df = sb_select("activity_log", "*", order=("date", "desc"))
-    if not df.empty:
-        st.dataframe(df, use_container_width=True)
-    else:
-        st.info("Belum ada activity.")
+    activity_list_fragment()
 
 # REPORTS
 elif menu == "Reports":
@@ -442,13 +1010,16 @@ elif menu == "Reports":
     st.write(stats)
     st.markdown("---")
     if st.button("Export Semua Tables ke CSV (Backup)"):
-        for t in ["spare_parts", "work_orders", "assets", "pm_plans", "activity_log", "stock_txn", "wo_parts"]:
-            df = sb_select(t, "*")
-            if not df.empty:
-                p = save_backup_csv(df, t + "_backup")
+        stamp = backup_stamp()  # one timestamp for the whole export set
+        # tables are independent: download them concurrently, report in order
+        paths = run_parallel(*[lambda t=t: backup_table_csv(t, t + "_backup", stamp=stamp) for t in BACKUP_TABLES])
+        for t, p in zip(BACKUP_TABLES, paths):
+            if p:
                 st.write(f"{t} -> {p}")
         st.success("Semua tabel dibackup ke folder data/")
 
+    csv_download_fragment()
+
 # SETTINGS
 elif menu == "Settings":
     st.title("⚙️ Settings & Info")
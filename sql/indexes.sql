@@ -0,0 +1,40 @@
+-- B-tree indexes for the filters / sort orders used by app.py.
+-- Safe to re-run.
+
+-- Dashboard / Reports counts (cmms_report_stats, generate_basic_reports)
+create index if not exists ix_wo_status on work_orders (status);
+create index if not exists ix_wo_asset on work_orders (asset_id);
+create index if not exists ix_pm_due on pm_plans (next_due_date);
+-- low stock is served by ix_parts_is_low on the generated is_low column (sql/low_stock.sql)
+drop index if exists ix_parts_low;
+
+-- the "newest first" Work Orders list and Dashboard recent WOs
+create index if not exists ix_wo_created on work_orders (created_at);
+
+-- Activity list, ordered by date and filtered by type
+create index if not exists ix_act_date on activity_log (date, type);
+
+-- load_inventory / load_assets ordering and the kode_barang lookup
+create index if not exists ix_parts_nama on spare_parts (nama_barang);
+-- unique: also the on_conflict target for spare-parts upserts (import_parts, add_or_update_part).
+-- Replaces the earlier non-unique ix_parts_kode. Fails if kode_barang has duplicates; find them with
+--   select kode_barang, count(*) from spare_parts group by 1 having count(*) > 1;
+-- and merge/delete them first (until then the app falls back to update-then-insert).
+drop index if exists ix_parts_kode;
+create unique index if not exists ux_parts_kode on spare_parts (kode_barang);
+create index if not exists ix_assets_name on assets (name);
+
+-- Inventory search: nama_barang / kode_barang ilike '%keyword%' (load_inventory)
+create extension if not exists pg_trgm;
+create index if not exists ix_parts_nama_trgm on spare_parts using gin (nama_barang gin_trgm_ops);
+create index if not exists ix_parts_kode_trgm on spare_parts using gin (kode_barang gin_trgm_ops);
+
+-- Foreign-key columns used in joins (Postgres does not index FKs automatically)
+create index if not exists ix_pm_asset on pm_plans (asset_id);
+create index if not exists ix_act_asset on activity_log (asset_id);
+create index if not exists ix_wop_wo on wo_parts (wo_id);
+create index if not exists ix_wop_part on wo_parts (part_id);
+create index if not exists ix_txn_part on stock_txn (part_id);
+
+-- refresh planner statistics after adding indexes
+analyze;
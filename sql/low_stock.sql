@@ -0,0 +1,13 @@
+-- Parts below their minimum stock, filtered in Postgres.
+-- PostgREST cannot compare two columns in a query string, so the flag is a
+-- stored generated column the app filters with is_low=eq.true: the Inventory
+-- "Hanya stok rendah" list and the dashboard count (see load_low_stock() and
+-- count_low_stock() in app.py). The partial index holds only flagged rows.
+alter table spare_parts
+  add column if not exists is_low boolean
+  generated always as (available_stock < minimum_stock) stored;
+
+create index if not exists ix_parts_is_low on spare_parts (is_low) where is_low;
+
+-- the earlier low_stock_parts view is superseded by is_low
+drop view if exists low_stock_parts;
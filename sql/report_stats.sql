@@ -0,0 +1,17 @@
+-- Summary counts for the Dashboard / Reports pages in a single round-trip.
+-- Used by generate_basic_reports() in app.py; the app falls back to
+-- client-side counting when this function is not deployed.
+-- Requires sql/low_stock.sql (spare_parts.is_low) to be applied first.
+create or replace function cmms_report_stats()
+returns json
+language sql
+stable
+as $$
+  select json_build_object(
+    'total_wo',        (select count(*) from work_orders),
+    'open_wo',         (select count(*) from work_orders where status = 'Open'),
+    'total_parts',     (select count(*) from spare_parts),
+    'low_stock_count', (select count(*) from spare_parts where is_low),
+    'pm_due',          (select count(*) from pm_plans where next_due_date::date <= current_date)
+  );
+$$;
@@ -0,0 +1,34 @@
+-- Atomic per-day Work Order sequence, used by make_wo_no() in app.py.
+-- One indexed row update per WO instead of counting today's rows, and
+-- concurrent submits can never receive the same number.
+create table if not exists wo_seq (
+  day text primary key,
+  seq integer not null
+);
+
+-- no policies: API keys cannot read or change the counters through PostgREST;
+-- only next_wo_no() (security definer, runs as the table owner) touches them
+alter table wo_seq enable row level security;
+
+create or replace function next_wo_no(p_day text)
+returns text
+language plpgsql
+security definer
+set search_path = public
+as $$
+declare
+  n integer;
+begin
+  update wo_seq set seq = seq + 1 where day = p_day returning seq into n;
+  if not found then
+    -- first call of the day: continue after any numbers the count-based
+    -- fallback in app.py already issued today (e.g. migration applied mid-day)
+    insert into wo_seq as s (day, seq)
+    values (p_day, (select count(*) from work_orders where wo_no like 'WO-' || p_day || '-%') + 1)
+    on conflict (day) do update set seq = s.seq + 1
+    returning seq into n;
+  end if;
+  -- at least 3 digits, like Python's f"{seq:03d}" (lpad alone would truncate 1000 to '100')
+  return 'WO-' || p_day || '-' || case when n < 1000 then lpad(n::text, 3, '0') else n::text end;
+end;
+$$;